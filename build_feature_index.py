@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+Index structural features of benchmark models/specs and predict runtimes.
+
+Usage:
+    python build_feature_index.py index [--benchmarks DIR] [--index FILE]
+    python build_feature_index.py fit --tool {abcrown,luna} <results_dir> [<results_dir> ...]
+    python build_feature_index.py predict --tool {abcrown,luna} --time-limit N <benchmark_set>
+
+'index' walks benchmarks/*/onnx and benchmarks/*/vnnlib (plain or .gz) and
+caches per-file features in a single JSON index (default: feature_index.json).
+Files whose size and mtime are unchanged are not parsed again.
+
+ONNX features: parameter count, node count, per-op counts, affine layer and
+activation counts, input dimension and output count. VNNLIB features: number
+of inputs/outputs, number of input regions and output disjuncts, and the
+(log10) volume of the input box.
+
+'fit' trains a ridge regression on log(runtime) from past campaigns (the
+result directories read by compile_results.py) and stores it in the index.
+By default it trains on CPU time, matching runlim -t; use --metric wall_time
+for campaigns run with --wall-time or on GPU partitions.
+
+'predict' prints one line per benchmark set entry with a suggested per-task
+time limit and the predicted runtime, as used by submit-job.sh --runtime-index.
+"""
+
+import argparse
+import gzip
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+from compile_results import benchmark_path, collect_results_for_tool
+
+INDEX_VERSION = 1
+
+# Ops counted as affine layers and as nonlinear activations
+AFFINE_OPS = {"Gemm", "MatMul", "Conv", "ConvTranspose"}
+ACTIVATION_OPS = {"Relu", "LeakyRelu", "Sigmoid", "Tanh", "Softmax", "Sign", "MaxPool", "Max", "Min"}
+
+# Inputs to the runtime predictor, derived from an (onnx, vnnlib) feature pair
+MODEL_FEATURES = [
+    "log_num_parameters",
+    "log_num_nodes",
+    "log_num_affine_layers",
+    "log_num_activations",
+    "log_input_dim",
+    "log_output_dim",
+    "log_num_input_regions",
+    "log_num_output_disjuncts",
+    "log_num_free_inputs",
+    "log10_input_volume",
+]
+
+
+#
+# Minimal protobuf wire-format reader (enough to walk an ONNX ModelProto)
+#
+
+def read_varint(buf, pos):
+    """Read a varint from buf at pos, return (value, new_pos)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def iter_fields(buf):
+    """Yield (field_number, wire_type, value) for each field of a message.
+
+    Length-delimited values are returned as memoryview slices (no copy),
+    all other values as ints.
+    """
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, pos = read_varint(buf, pos)
+        elif wire_type == 1:
+            value = int.from_bytes(buf[pos:pos + 8], "little")
+            pos += 8
+        elif wire_type == 2:
+            length, pos = read_varint(buf, pos)
+            value = buf[pos:pos + length]
+            pos += length
+        elif wire_type == 5:
+            value = int.from_bytes(buf[pos:pos + 4], "little")
+            pos += 4
+        else:
+            raise ValueError(f"unsupported protobuf wire type {wire_type}")
+        yield field, wire_type, value
+
+
+def to_int64(value):
+    """Interpret an unsigned varint as a signed int64."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def parse_tensor_size(buf):
+    """Return (name, number of elements) of a TensorProto."""
+    name = None
+    dims = []
+    for field, wire_type, value in iter_fields(buf):
+        if field == 1:
+            if wire_type == 2:  # packed dims
+                pos = 0
+                while pos < len(value):
+                    dim, pos = read_varint(value, pos)
+                    dims.append(to_int64(dim))
+            else:
+                dims.append(to_int64(value))
+        elif field == 8:
+            name = bytes(value).decode()
+    return name, math.prod(dims)
+
+
+def parse_value_info(buf):
+    """Return (name, shape) of a ValueInfoProto; symbolic dims become None."""
+    name = None
+    shape = []
+    for field, _, value in iter_fields(buf):
+        if field == 1:
+            name = bytes(value).decode()
+        elif field == 2:  # TypeProto
+            for type_field, _, type_value in iter_fields(value):
+                if type_field != 1:  # tensor_type
+                    continue
+                for tensor_field, _, tensor_value in iter_fields(type_value):
+                    if tensor_field != 2:  # shape
+                        continue
+                    for _, _, dim in iter_fields(tensor_value):
+                        dim_value = None
+                        for dim_field, _, v in iter_fields(dim):
+                            if dim_field == 1:
+                                dim_value = to_int64(v)
+                        shape.append(dim_value)
+    return name, shape
+
+
+def shape_size(shape):
+    """Number of elements of a shape, treating symbolic/batch dims as 1."""
+    return math.prod(d for d in shape if d is not None and d > 0)
+
+
+def extract_onnx_features(data):
+    """Extract structural features from a serialized ONNX model."""
+    graph = None
+    for field, _, value in iter_fields(memoryview(data)):
+        if field == 7:
+            graph = value
+    if graph is None:
+        raise ValueError("no graph in ONNX model")
+
+    op_counts = {}
+    num_parameters = 0
+    initializer_names = set()
+    inputs = []
+    outputs = []
+
+    for field, _, value in iter_fields(graph):
+        if field == 1:  # NodeProto
+            op_type = None
+            attributes = []
+            for node_field, _, node_value in iter_fields(value):
+                if node_field == 4:
+                    op_type = bytes(node_value).decode()
+                elif node_field == 5:
+                    attributes.append(node_value)
+            op_counts[op_type] = op_counts.get(op_type, 0) + 1
+            # Constant nodes may carry weights instead of initializers
+            if op_type == "Constant":
+                for attribute in attributes:
+                    for attr_field, _, attr_value in iter_fields(attribute):
+                        if attr_field == 5:  # t
+                            num_parameters += parse_tensor_size(attr_value)[1]
+        elif field == 5:  # initializer
+            name, size = parse_tensor_size(value)
+            initializer_names.add(name)
+            num_parameters += size
+        elif field == 11:
+            inputs.append(parse_value_info(value))
+        elif field == 12:
+            outputs.append(parse_value_info(value))
+
+    # Older exporters list initializers as graph inputs as well
+    inputs = [(name, shape) for name, shape in inputs if name not in initializer_names]
+
+    return {
+        "num_parameters": num_parameters,
+        "num_nodes": sum(op_counts.values()),
+        "num_affine_layers": sum(op_counts.get(op, 0) for op in AFFINE_OPS),
+        "num_activations": sum(op_counts.get(op, 0) for op in ACTIVATION_OPS),
+        "op_counts": dict(sorted(op_counts.items())),
+        "input_dim": sum(shape_size(shape) for _, shape in inputs),
+        "output_dim": sum(shape_size(shape) for _, shape in outputs),
+    }
+
+
+#
+# VNNLIB features
+#
+
+NUMBER = r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+INPUT_BOUND_RE = re.compile(r"\((<=|>=)\s+X_(\d+)\s+" + NUMBER + r"\s*\)")
+INPUT_BOUND_REV_RE = re.compile(r"\((<=|>=)\s+" + NUMBER + r"\s+X_(\d+)\s*\)")
+DECLARE_RE = re.compile(r"\(declare-const\s+([XY])_(\d+)\s")
+OUTPUT_CONSTRAINT_RE = re.compile(r"\((?:<=|>=|<|>|=)[^()]*Y_\d+")
+
+
+def split_asserts(content):
+    """Split VNNLIB content into the bodies of its top-level asserts."""
+    # Strip comments first, they may contain parentheses
+    content = re.sub(r";[^\n]*", "", content)
+    bodies = []
+    pos = content.find("(assert")
+    while pos != -1:
+        depth = 0
+        for end in range(pos, len(content)):
+            c = content[end]
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        bodies.append(content[pos + len("(assert"):end])
+        pos = content.find("(assert", end)
+    return bodies
+
+
+def region_bounds(text, bounds):
+    """Update {index: [lower, upper]} with the X bounds asserted in text."""
+    for op, idx, value in INPUT_BOUND_RE.findall(text):
+        b = bounds.setdefault(int(idx), [-math.inf, math.inf])
+        if op == "<=":
+            b[1] = min(b[1], float(value))
+        else:
+            b[0] = max(b[0], float(value))
+    # Reversed form: (<= c X_i) is a lower bound
+    for op, value, idx in INPUT_BOUND_REV_RE.findall(text):
+        b = bounds.setdefault(int(idx), [-math.inf, math.inf])
+        if op == "<=":
+            b[0] = max(b[0], float(value))
+        else:
+            b[1] = min(b[1], float(value))
+    return bounds
+
+
+def box_volume(bounds):
+    """Return (number of free inputs, log10 volume over free inputs) of a box."""
+    free = 0
+    log_volume = 0.0
+    for lower, upper in bounds.values():
+        width = upper - lower
+        if width > 0:
+            free += 1
+            log_volume += math.log10(width) if math.isfinite(width) else math.inf
+    return free, log_volume
+
+
+def extract_vnnlib_features(content):
+    """Extract input region and output disjunct features from a VNNLIB spec."""
+    num_inputs = 0
+    num_outputs = 0
+    for var, idx in DECLARE_RE.findall(content):
+        if var == "X":
+            num_inputs = max(num_inputs, int(idx) + 1)
+        else:
+            num_outputs = max(num_outputs, int(idx) + 1)
+
+    common_bounds = {}
+    input_disjunctions = []
+    num_output_disjuncts = 1
+    num_output_constraints = 0
+
+    for body in split_asserts(content):
+        has_inputs = "X_" in body
+        is_or = body.lstrip().startswith("(or")
+        if has_inputs and is_or:
+            # Each (and ...) clause is one input region
+            input_disjunctions.append(re.split(r"\(and\b", body)[1:] or [body])
+        elif has_inputs:
+            region_bounds(body, common_bounds)
+        else:
+            num_output_constraints += len(OUTPUT_CONSTRAINT_RE.findall(body))
+            if is_or:
+                num_output_disjuncts *= max(1, len(re.findall(r"\(and\b", body)))
+
+    # Expand input regions: common bounds intersected with each clause
+    regions = [dict(common_bounds)]
+    for clauses in input_disjunctions:
+        regions = [
+            region_bounds(clause, {k: list(v) for k, v in region.items()})
+            for region in regions
+            for clause in clauses
+        ]
+
+    volumes = [box_volume(region) for region in regions]
+    num_free_inputs = max(free for free, _ in volumes)
+    # Union volume, approximated as the sum over regions
+    log_volumes = [v for _, v in volumes]
+    top = max(log_volumes)
+    if math.isfinite(top):
+        log10_input_volume = top + math.log10(sum(10 ** (v - top) for v in log_volumes))
+    else:
+        log10_input_volume = top
+
+    return {
+        "num_inputs": num_inputs,
+        "num_outputs": num_outputs,
+        "num_input_regions": len(regions),
+        "num_output_disjuncts": num_output_disjuncts,
+        "num_output_constraints": num_output_constraints,
+        "num_free_inputs": num_free_inputs,
+        "log10_input_volume": log10_input_volume,
+    }
+
+
+#
+# Index
+#
+
+def read_maybe_gzip(path):
+    """Read a file, decompressing it if it ends with .gz."""
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def load_index(index_path):
+    """Load the feature index, returning an empty index if missing or stale."""
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+    except Exception:
+        index = None
+
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        index = {"version": INDEX_VERSION, "onnx": {}, "vnnlib": {}, "models": {}}
+    return index
+
+
+def save_index(index, index_path):
+    """Write the feature index atomically."""
+    tmp_path = Path(f"{index_path}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+    tmp_path.replace(index_path)
+
+
+def update_index(index, benchmarks_dir):
+    """Parse new or changed benchmark files into the index.
+
+    Entries of files that no longer exist are removed.
+
+    Returns:
+        (number of parsed files, number of cached files, number of removed entries)
+    """
+    parsed = 0
+    cached = 0
+    removed = 0
+
+    for kind, extract in [("onnx", extract_onnx_features), ("vnnlib", extract_vnnlib_features)]:
+        entries = index[kind]
+        seen = set()
+        for path in sorted(benchmarks_dir.glob(f"*/{kind}/**/*")):
+            if not (path.name.endswith(f".{kind}") or path.name.endswith(f".{kind}.gz")):
+                continue
+
+            # Same form as benchmark_path(): relative to benchmarks/, without .gz
+            key = path.relative_to(benchmarks_dir).as_posix()
+            key = key[:-3] if key.endswith(".gz") else key
+            seen.add(key)
+            stat = path.stat()
+            stamp = {"size": stat.st_size, "mtime": stat.st_mtime}
+            entry = entries.get(key)
+            if entry is not None and entry.get("stamp") == stamp:
+                cached += 1
+                continue
+
+            try:
+                data = read_maybe_gzip(path)
+                if kind == "vnnlib":
+                    data = data.decode()
+                features = extract(data)
+            except Exception as e:
+                print(f"Warning: failed to parse {path}: {e}")
+                features = None
+
+            entries[key] = {"stamp": stamp, "features": features}
+            parsed += 1
+
+        for key in set(entries) - seen:
+            del entries[key]
+            removed += 1
+
+    return parsed, cached, removed
+
+
+#
+# Runtime predictor
+#
+
+def model_inputs(onnx_features, vnnlib_features):
+    """Map an (onnx, vnnlib) feature pair to the predictor inputs."""
+    volume = vnnlib_features["log10_input_volume"]
+    if not math.isfinite(volume):
+        volume = 0.0
+    return [
+        math.log1p(onnx_features["num_parameters"]),
+        math.log1p(onnx_features["num_nodes"]),
+        math.log1p(onnx_features["num_affine_layers"]),
+        math.log1p(onnx_features["num_activations"]),
+        math.log1p(onnx_features["input_dim"]),
+        math.log1p(onnx_features["output_dim"]),
+        math.log1p(vnnlib_features["num_input_regions"]),
+        math.log1p(vnnlib_features["num_output_disjuncts"]),
+        math.log1p(vnnlib_features["num_free_inputs"]),
+        volume,
+    ]
+
+
+def lookup_features(index, onnx_key, vnnlib_key):
+    """Return predictor inputs for an instance, or None if not indexed."""
+    onnx_entry = index["onnx"].get(onnx_key)
+    vnnlib_entry = index["vnnlib"].get(vnnlib_key)
+    if not onnx_entry or not vnnlib_entry:
+        return None
+    if onnx_entry["features"] is None or vnnlib_entry["features"] is None:
+        return None
+    return model_inputs(onnx_entry["features"], vnnlib_entry["features"])
+
+
+def solve(a, b):
+    """Solve the linear system a x = b by Gaussian elimination with pivoting."""
+    n = len(b)
+    m = [row[:] + [b[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        if m[col][col] == 0:
+            continue
+        for r in range(n):
+            if r != col and m[r][col] != 0:
+                factor = m[r][col] / m[col][col]
+                m[r] = [x - factor * y for x, y in zip(m[r], m[col])]
+    return [m[i][n] / m[i][i] if m[i][i] != 0 else 0.0 for i in range(n)]
+
+
+def fit_runtime_model(samples, metric, ridge=1.0):
+    """Fit a ridge regression of log(runtime) on standardized features.
+
+    Args:
+        samples: List of (feature vector, runtime in seconds)
+        metric: Runtime the samples measure ("cpu_time" or "wall_time")
+        ridge: L2 regularization strength
+
+    Returns:
+        dict with the model parameters and its residual standard deviation
+    """
+    xs = [x for x, _ in samples]
+    ys = [math.log(max(t, 1e-3)) for _, t in samples]
+    n = len(xs)
+    k = len(xs[0])
+
+    mean = [sum(x[j] for x in xs) / n for j in range(k)]
+    scale = [
+        math.sqrt(sum((x[j] - mean[j]) ** 2 for x in xs) / n) or 1.0
+        for j in range(k)
+    ]
+    zs = [[(x[j] - mean[j]) / scale[j] for j in range(k)] for x in xs]
+    y_mean = sum(ys) / n
+
+    # Normal equations (Z^T Z + ridge I) w = Z^T (y - mean(y))
+    a = [
+        [sum(z[i] * z[j] for z in zs) + (ridge if i == j else 0.0) for j in range(k)]
+        for i in range(k)
+    ]
+    b = [sum(z[i] * (y - y_mean) for z, y in zip(zs, ys)) for i in range(k)]
+    weights = solve(a, b)
+
+    residuals = [
+        y - y_mean - sum(w * zj for w, zj in zip(weights, z))
+        for z, y in zip(zs, ys)
+    ]
+    residual_std = math.sqrt(sum(r * r for r in residuals) / n)
+
+    return {
+        "features": MODEL_FEATURES,
+        "metric": metric,
+        "mean": mean,
+        "scale": scale,
+        "weights": weights,
+        "intercept": y_mean,
+        "residual_std": residual_std,
+        "num_samples": n,
+    }
+
+
+def predict_runtime(model, x):
+    """Predict the runtime in seconds for a feature vector."""
+    z = [(xj - m) / s for xj, m, s in zip(x, model["mean"], model["scale"])]
+    return math.exp(model["intercept"] + sum(w * zj for w, zj in zip(model["weights"], z)))
+
+
+def collect_training_samples(index, tool_name, results_dirs, metric):
+    """Match past campaign results to indexed features.
+
+    Instances are matched on their onnx/vnnlib paths below benchmarks/.
+    'metric' selects the runtime to train on ("cpu_time" or "wall_time"),
+    which must match the limit the jobs run under. Only runs that finished
+    normally (limit status "ok") with a result or bounds are used: the
+    runtime of timed-out, out-of-memory or crashed runs is not the time the
+    instance needs, and keeping timeouts would feed predicted limits back
+    into the next fit.
+    """
+    samples = []
+    skipped = 0
+    for results_dir in results_dirs:
+        for r in collect_results_for_tool(tool_name, results_dir, time_output=True):
+            if r["limit_status"] != "ok" or r["timed_out"] or r[metric] is None:
+                skipped += 1
+                continue
+            if r["status"] is None and r["bound_width"] is None:
+                skipped += 1
+                continue
+            if not r["onnx_path"] or not r["vnnlib_path"]:
+                skipped += 1
+                continue
+            x = lookup_features(index, r["onnx_path"], r["vnnlib_path"])
+            if x is None:
+                skipped += 1
+                continue
+            samples.append((x, r[metric]))
+
+    return samples, skipped
+
+
+def suggest_time_limit(model, x, time_limit, min_time_limit, sigmas):
+    """Return (time limit, predicted runtime) for an instance.
+
+    The limit is the prediction widened by 'sigmas' residual standard
+    deviations (in log space), clamped to [min_time_limit, time_limit].
+    Without a model or features the full time limit is used.
+    """
+    if model is None or x is None:
+        return time_limit, None
+    predicted = predict_runtime(model, x)
+    limit = predicted * math.exp(sigmas * model["residual_std"])
+    limit = min(time_limit, max(min_time_limit, math.ceil(limit)))
+    return limit, predicted
+
+
+#
+# Commands
+#
+
+def cmd_index(args):
+    index = load_index(args.index)
+    parsed, cached, removed = update_index(index, args.benchmarks)
+    save_index(index, args.index)
+    print(f"Indexed {parsed} files ({cached} cached, {removed} removed) into {args.index}")
+    return 0
+
+
+def cmd_fit(args):
+    index = load_index(args.index)
+    samples, skipped = collect_training_samples(index, args.tool, args.results, args.metric)
+    print(f"Matched {len(samples)} instances ({skipped} skipped)")
+    if len(samples) < len(MODEL_FEATURES) + 1:
+        print(f"Error: not enough instances to fit a model for {args.tool}", file=sys.stderr)
+        return 1
+
+    model = fit_runtime_model(samples, args.metric, ridge=args.ridge)
+    index["models"][args.tool] = model
+    save_index(index, args.index)
+    print(f"Fitted {args.tool} {args.metric} model (residual std {model['residual_std']:.3f} in log seconds)")
+    return 0
+
+
+def cmd_predict(args):
+    index = load_index(args.index)
+    model = index["models"].get(args.tool)
+    if model is None:
+        print(f"Warning: no {args.tool} model in {args.index}, using full time limit", file=sys.stderr)
+    elif model.get("metric") != args.metric:
+        print(f"Warning: {args.tool} model predicts {model.get('metric')}, not {args.metric}, "
+              "using full time limit", file=sys.stderr)
+        model = None
+
+    with open(args.benchmark_set, "r") as f:
+        for line in f:
+            files = line.split()
+            x = None
+            if len(files) >= 2:
+                x = lookup_features(index, benchmark_path(files[0]), benchmark_path(files[1]))
+            limit, predicted = suggest_time_limit(model, x, args.time_limit, args.min_time_limit, args.sigmas)
+            print(f"{limit} {predicted:.2f}" if predicted is not None else f"{limit} --")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index benchmark model/spec features and predict verification runtimes."
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=Path("feature_index.json"),
+        help="Feature index file (default: ./feature_index.json)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subparsers.add_parser("index", help="Index ONNX and VNNLIB features")
+    index_parser.add_argument(
+        "--benchmarks",
+        type=Path,
+        default=Path("benchmarks"),
+        help="Benchmarks directory (default: ./benchmarks)"
+    )
+    index_parser.set_defaults(func=cmd_index)
+
+    fit_parser = subparsers.add_parser("fit", help="Fit a runtime predictor from past campaigns")
+    fit_parser.add_argument("--tool", choices=["abcrown", "luna"], required=True)
+    fit_parser.add_argument(
+        "--metric",
+        choices=["cpu_time", "wall_time"],
+        default="cpu_time",
+        help="Runtime to train on (default: cpu_time)"
+    )
+    fit_parser.add_argument(
+        "--ridge",
+        type=float,
+        default=1.0,
+        help="L2 regularization strength (default: 1.0)"
+    )
+    fit_parser.add_argument(
+        "results",
+        type=Path,
+        nargs="+",
+        help="Results directories (contain benchmark subdirs with slurm-* folders)"
+    )
+    fit_parser.set_defaults(func=cmd_fit)
+
+    predict_parser = subparsers.add_parser("predict", help="Suggest per-instance time limits")
+    predict_parser.add_argument("--tool", choices=["abcrown", "luna"], required=True)
+    predict_parser.add_argument(
+        "--metric",
+        choices=["cpu_time", "wall_time"],
+        default="cpu_time",
+        help="Runtime the time limit applies to (default: cpu_time)"
+    )
+    predict_parser.add_argument(
+        "--time-limit",
+        type=int,
+        required=True,
+        help="Maximum time limit in seconds"
+    )
+    predict_parser.add_argument(
+        "--min-time-limit",
+        type=int,
+        default=60,
+        help="Minimum time limit in seconds (default: 60)"
+    )
+    predict_parser.add_argument(
+        "--sigmas",
+        type=float,
+        default=2.0,
+        help="Residual standard deviations added to the prediction (default: 2.0)"
+    )
+    predict_parser.add_argument(
+        "benchmark_set",
+        type=Path,
+        help="Benchmark set file (one 'onnx vnnlib' pair per line)"
+    )
+    predict_parser.set_defaults(func=cmd_predict)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
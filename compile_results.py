@@ -6,6 +6,9 @@ Usage:
     python compile_results.py <luna_results_dir> <abcrown_results_dir>
 
 Each results directory should contain benchmark subdirectories with slurm-* folders.
+Jobs submitted with submit-job.sh write a result.json record per instance, which
+is read directly; older campaigns without records fall back to parsing run.out
+and output.log.
 
 Generates two CSVs per tool:
 1. Per-instance results (one row per slurm job)
@@ -15,104 +18,155 @@ Only includes instances where BOTH tools have results (either timeout or compute
 """
 
 import argparse
+import json
 import re
 import csv
 from pathlib import Path
 from collections import defaultdict
 
+# Per-instance result record written by write_result_record.py
+RESULT_RECORD_NAME = "result.json"
+RESULT_RECORD_VERSION = 1
+
+# Floating point number as printed by the tools (exponents, inf and nan included)
+FLOAT = r"[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|inf(?:inity)?|nan)"
 
-def parse_args_line(content):
-    """Extract onnx and vnnlib filenames from 'c args:' line."""
-    onnx_file = None
-    vnnlib_file = None
+
+def benchmark_path(path):
+    """Return a benchmark file path relative to benchmarks/, without .gz.
+
+    For example /x/benchmarks/acasxu_2023/vnnlib/prop_1.vnnlib.gz becomes
+    acasxu_2023/vnnlib/prop_1.vnnlib, matching the paths in benchmark_set_* files.
+    If no 'benchmarks' directory is in the path, the path is taken from the
+    directory above the last 'onnx' or 'vnnlib' directory.
+    """
+    path = Path(path)
+    parts = [p for p in path.parts if p not in (".", path.anchor)]
+    if "benchmarks" in parts:
+        parts = parts[len(parts) - parts[::-1].index("benchmarks"):]
+    else:
+        kinds = [i for i, p in enumerate(parts[:-1]) if p in ("onnx", "vnnlib")]
+        if kinds and kinds[-1] > 0:
+            parts = parts[kinds[-1] - 1:]
+    key = "/".join(parts)
+    return key[:-3] if key.endswith(".gz") else key
+
+
+def parse_args_paths(content):
+    """Extract onnx and vnnlib paths (relative to benchmarks/) from 'c args:' line."""
+    onnx_path = None
+    vnnlib_path = None
 
     match = re.search(r"^c args:\s+(.+)$", content, re.MULTILINE)
     if match:
         args = match.group(1).strip().split()
         for arg in args:
             if arg.endswith(".onnx"):
-                onnx_file = Path(arg).name
+                onnx_path = benchmark_path(arg)
             elif arg.endswith(".vnnlib"):
-                vnnlib_file = Path(arg).name
+                vnnlib_path = benchmark_path(arg)
+
+    return onnx_path, vnnlib_path
 
+
+def parse_args_line(content):
+    """Extract onnx and vnnlib filenames from 'c args:' line."""
+    onnx_path, vnnlib_path = parse_args_paths(content)
+    onnx_file = Path(onnx_path).name if onnx_path else None
+    vnnlib_file = Path(vnnlib_path).name if vnnlib_path else None
     return onnx_file, vnnlib_file
 
 
+def parse_float_list(text):
+    """Parse a comma-separated list of floats, returning None if malformed."""
+    try:
+        return [float(x.strip()) for x in text.split(",")]
+    except ValueError:
+        return None
+
+
+def parse_common_run_out(content):
+    """Fields shared by all tools: file names/paths, time limit and the raw 'Result:' value."""
+    result = {
+        "lower_bounds": None, "upper_bounds": None, "status": None, "result": None, "time": None, "time_limit": None,
+        "onnx_file": None, "vnnlib_file": None, "onnx_path": None, "vnnlib_path": None,
+    }
+
+    # Extract onnx and vnnlib filenames and paths
+    result["onnx_file"], result["vnnlib_file"] = parse_args_line(content)
+    result["onnx_path"], result["vnnlib_path"] = parse_args_paths(content)
+
+    # Extract the per-task time limit set by submit-job.sh
+    match = re.search(r"^c timelimit:\s*(\d+)", content, re.MULTILINE)
+    if match:
+        result["time_limit"] = int(match.group(1))
+
+    # Extract raw result (sat, unsat, unknown, timeout, ...)
+    match = re.search(r"^Result:\s*(\w+)", content, re.MULTILINE)
+    if match:
+        result["result"] = match.group(1).lower()
+
+    return result
+
+
 def parse_abcrown_run_out(filepath):
     """Parse abcrown run.out file for bounds, result, and time."""
-    result = {"lower_bounds": None, "upper_bounds": None, "status": None, "time": None, "onnx_file": None, "vnnlib_file": None}
-
     try:
         with open(filepath, "r") as f:
             content = f.read()
     except Exception:
-        return result
+        return parse_common_run_out("")
 
-    # Extract onnx and vnnlib filenames
-    result["onnx_file"], result["vnnlib_file"] = parse_args_line(content)
+    result = parse_common_run_out(content)
 
-    # Extract result status (unsat, timeout, unknown)
-    match = re.search(r"^Result:\s*(\w+)", content, re.MULTILINE)
-    if match:
-        status = match.group(1).lower()
-        # Normalize to verified/unverified
-        if status == "unsat":
+    # Normalize result status (unsat, timeout, unknown) to verified/unverified
+    if result["result"] is not None:
+        if result["result"] == "unsat":
             result["status"] = "verified"
         else:
-            result["status"] = status  # timeout or unknown
+            result["status"] = result["result"]  # timeout or unknown
 
     # Extract time
-    match = re.search(r"^Time:\s*([\d.]+)", content, re.MULTILINE)
+    match = re.search(r"^Time:\s*(" + FLOAT + r")", content, re.MULTILINE)
     if match:
         result["time"] = float(match.group(1))
 
     # Extract final alpha-crown bounds (prefer these over initial CROWN bounds)
     # Format: initial alpha-crown lower bounds: [val1, val2, ...]
-    lower_match = re.search(r"initial alpha-crown lower bounds:\s*\[([-\d.,\s]+)\]", content)
-    upper_match = re.search(r"initial alpha-crown upper bounds:\s*\[([-\d.,\s]+)\]", content)
+    lower_match = re.search(r"initial alpha-crown lower bounds:\s*\[([^\[\]]*)\]", content)
+    upper_match = re.search(r"initial alpha-crown upper bounds:\s*\[([^\[\]]*)\]", content)
 
     # Fallback to initial CROWN bounds if alpha-crown not found
     if not lower_match:
-        lower_match = re.search(r"initial CROWN lower bounds:\s*\[([-\d.,\s]+)\]", content)
+        lower_match = re.search(r"initial CROWN lower bounds:\s*\[([^\[\]]*)\]", content)
     if not upper_match:
-        upper_match = re.search(r"initial CROWN upper bounds:\s*\[([-\d.,\s]+)\]", content)
+        upper_match = re.search(r"initial CROWN upper bounds:\s*\[([^\[\]]*)\]", content)
 
     if lower_match:
-        try:
-            result["lower_bounds"] = [float(x.strip()) for x in lower_match.group(1).split(",")]
-        except ValueError:
-            pass
+        result["lower_bounds"] = parse_float_list(lower_match.group(1))
 
     if upper_match:
-        try:
-            result["upper_bounds"] = [float(x.strip()) for x in upper_match.group(1).split(",")]
-        except ValueError:
-            pass
+        result["upper_bounds"] = parse_float_list(upper_match.group(1))
 
     return result
 
 
 def parse_luna_run_out(filepath):
     """Parse luna run.out file for bounds and result."""
-    result = {"lower_bounds": None, "upper_bounds": None, "status": None, "time": None, "onnx_file": None, "vnnlib_file": None}
-
     try:
         with open(filepath, "r") as f:
             content = f.read()
     except Exception:
-        return result
+        return parse_common_run_out("")
 
-    # Extract onnx and vnnlib filenames
-    result["onnx_file"], result["vnnlib_file"] = parse_args_line(content)
+    result = parse_common_run_out(content)
 
-    # Extract result status - Luna outputs: "Result: unsat", "Result: sat", "Result: unknown"
+    # Normalize result status - Luna outputs: "Result: unsat", "Result: sat", "Result: unknown"
     # unsat = property verified (no counterexample exists)
     # sat = counterexample found (property violated/disproved)
     # Both count as "verified" since the property was resolved
-    match = re.search(r"^Result:\s*(\w+)", content, re.MULTILINE)
-    if match:
-        status = match.group(1).lower()
-        if status in ("unsat", "sat"):
+    if result["result"] is not None:
+        if result["result"] in ("unsat", "sat"):
             result["status"] = "verified"
         else:
             result["status"] = "unknown"
@@ -133,7 +187,7 @@ def parse_luna_run_out(filepath):
     if match:
         bounds_line = match.group(1).strip()
         # Parse all [lower, upper] pairs
-        pairs = re.findall(r"\[([-\d.]+),\s*([-\d.]+)\]", bounds_line)
+        pairs = re.findall(r"\[\s*(" + FLOAT + r")\s*,\s*(" + FLOAT + r")\s*\]", bounds_line, re.IGNORECASE)
         if pairs:
             result["lower_bounds"] = [float(p[0]) for p in pairs]
             result["upper_bounds"] = [float(p[1]) for p in pairs]
@@ -141,13 +195,33 @@ def parse_luna_run_out(filepath):
     return result
 
 
-def parse_output_log(filepath):
-    """Parse output.log file for runlim wall clock time and timeout status.
+def parse_elapsed(value):
+    """Convert a '/usr/bin/time' elapsed string (h:mm:ss or m:ss.ss) to seconds."""
+    seconds = 0.0
+    for part in value.strip().split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_output_log(filepath, time_output=False):
+    """Parse output.log file for wall/cpu time, memory and timeout status.
+
+    Handles runlim output (CPU partitions). With time_output, '/usr/bin/time -v'
+    output combined with 'timeout' (GPU partitions) is parsed as well; this is
+    only done when writing result records, so re-compiling old campaigns gives
+    the same numbers as before.
 
     Returns:
-        dict with 'wall_time' (float or None) and 'timed_out' (bool)
+        dict with 'wall_time', 'cpu_time' (seconds), 'max_memory_mb' (float or None),
+        'limit_status' (runlim status or exit status) and 'timed_out' (bool)
     """
-    result = {"wall_time": None, "timed_out": False}
+    result = {
+        "wall_time": None,
+        "cpu_time": None,
+        "max_memory_mb": None,
+        "limit_status": None,
+        "timed_out": False,
+    }
 
     try:
         with open(filepath, "r") as f:
@@ -155,22 +229,97 @@ def parse_output_log(filepath):
     except Exception:
         return result
 
-    # Extract real (wall clock) time from runlim output
+    # Extract real (wall clock) time, cpu time and memory from runlim output
     # Format: [runlim] real:			11.46 seconds
+    #         [runlim] time:			10.92 seconds
+    #         [runlim] space:			512.3 MB
     match = re.search(r"\[runlim\]\s*real:\s*([\d.]+)\s*seconds", content)
     if match:
         result["wall_time"] = float(match.group(1))
 
+    match = re.search(r"\[runlim\]\s*time:\s*([\d.]+)\s*seconds", content)
+    if match:
+        result["cpu_time"] = float(match.group(1))
+
+    match = re.search(r"\[runlim\]\s*space:\s*([\d.]+)\s*MB", content)
+    if match:
+        result["max_memory_mb"] = float(match.group(1))
+
     # Check for timeout status
     # Format: [runlim] status:		out of time
     status_match = re.search(r"\[runlim\]\s*status:\s*(.+)", content)
     if status_match:
         status = status_match.group(1).strip().lower()
+        result["limit_status"] = status
         result["timed_out"] = (status == "out of time")
 
+    # /usr/bin/time -v format:
+    #   Elapsed (wall clock) time (h:mm:ss or m:ss): 0:11.46
+    #   User time (seconds): 10.50
+    #   System time (seconds): 0.42
+    #   Maximum resident set size (kbytes): 524596
+    #   Command exited with non-zero status 124
+    if not time_output:
+        return result
+
+    if result["wall_time"] is None:
+        match = re.search(r"Elapsed \(wall clock\) time \([^)]*\):\s*([\d:.]+)\s*$", content, re.MULTILINE)
+        if match:
+            result["wall_time"] = parse_elapsed(match.group(1))
+
+    if result["cpu_time"] is None:
+        user = re.search(r"User time \(seconds\):\s*([\d.]+)", content)
+        system = re.search(r"System time \(seconds\):\s*([\d.]+)", content)
+        if user and system:
+            result["cpu_time"] = float(user.group(1)) + float(system.group(1))
+
+    if result["max_memory_mb"] is None:
+        match = re.search(r"Maximum resident set size \(kbytes\):\s*(\d+)", content)
+        if match:
+            result["max_memory_mb"] = int(match.group(1)) / 1024
+
+    if result["limit_status"] is None:
+        match = re.search(r"Command exited with non-zero status (\d+)", content)
+        if match:
+            exit_status = int(match.group(1))
+            result["limit_status"] = f"exit {exit_status}"
+            # timeout(1) exits with 124 when the time limit is hit
+            result["timed_out"] = (exit_status == 124)
+        elif "Elapsed (wall clock) time" in content:
+            result["limit_status"] = "ok"
+
     return result
 
 
+def load_result_record(filepath):
+    """Load a result.json record written at job end.
+
+    Returns:
+        dict with the record fields, or None if the record is missing,
+        unreadable, of an unknown version or not tied to an instance
+    """
+    try:
+        with open(filepath, "r") as f:
+            record = json.load(f)
+    except Exception:
+        return None
+
+    if not isinstance(record, dict) or record.get("version") != RESULT_RECORD_VERSION:
+        return None
+    if not record.get("onnx_file") or not record.get("vnnlib_file"):
+        return None
+
+    # Non-finite bounds are stored as strings ("inf", "-inf", "nan")
+    for key in ("lower_bounds", "upper_bounds"):
+        if record.get(key) is not None:
+            try:
+                record[key] = [float(x) for x in record[key]]
+            except (TypeError, ValueError):
+                record[key] = None
+
+    return record
+
+
 def compute_bound_width(lower_bounds, upper_bounds):
     """Compute average width of bound intervals."""
     if not lower_bounds or not upper_bounds:
@@ -182,12 +331,14 @@ def compute_bound_width(lower_bounds, upper_bounds):
     return sum(widths) / len(widths)
 
 
-def collect_results_for_tool(tool_name, tool_path):
+def collect_results_for_tool(tool_name, tool_path, time_output=False):
     """Collect all results for a given tool from a directory.
 
     Args:
         tool_name: "abcrown" or "luna"
         tool_path: Path to directory containing benchmark subdirectories
+        time_output: Also parse '/usr/bin/time -v' output of old campaigns
+            without result records (see parse_output_log)
     """
     results = []
 
@@ -215,17 +366,29 @@ def collect_results_for_tool(tool_name, tool_path):
                 run_out = slurm_dir / "run.out"
                 output_log = slurm_dir / "output.log"
 
-                if not run_out.exists():
-                    continue
-
-                # Parse output.log for wall clock time and timeout status
-                log_data = parse_output_log(output_log) if output_log.exists() else {"wall_time": None, "timed_out": False}
-
-                # Parse based on tool
-                if tool_name == "abcrown":
-                    data = parse_abcrown_run_out(run_out)
-                else:  # luna
-                    data = parse_luna_run_out(run_out)
+                # Prefer the structured record written at job end
+                record = load_result_record(slurm_dir / RESULT_RECORD_NAME)
+                if record is not None:
+                    data = record
+                    log_data = {
+                        "wall_time": record.get("wall_time"),
+                        "cpu_time": record.get("cpu_time"),
+                        "limit_status": record.get("limit_status"),
+                        "timed_out": bool(record.get("timed_out")),
+                    }
+                else:
+                    # Fallback for old campaigns: parse the logs
+                    if not run_out.exists():
+                        continue
+
+                    # Parse output.log for wall clock time and timeout status
+                    log_data = parse_output_log(output_log, time_output=time_output)
+
+                    # Parse based on tool
+                    if tool_name == "abcrown":
+                        data = parse_abcrown_run_out(run_out)
+                    else:  # luna
+                        data = parse_luna_run_out(run_out)
 
                 # Compute bound width
                 bound_width = compute_bound_width(data["lower_bounds"], data["upper_bounds"])
@@ -241,8 +404,13 @@ def collect_results_for_tool(tool_name, tool_path):
                     "slurm_id": slurm_id,
                     "onnx_file": data["onnx_file"],
                     "vnnlib_file": data["vnnlib_file"],
+                    "onnx_path": data.get("onnx_path"),
+                    "vnnlib_path": data.get("vnnlib_path"),
                     "status": data["status"],
                     "wall_time": log_data["wall_time"],
+                    "cpu_time": log_data["cpu_time"],
+                    "time_limit": data.get("time_limit"),
+                    "limit_status": log_data["limit_status"],
                     "timed_out": log_data["timed_out"],
                     "has_result": has_result,
                     "bound_width": bound_width,
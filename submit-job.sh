@@ -41,6 +41,7 @@ cmpr=
 sbatch_options=
 tool_dir=""
 python_bin="python3"
+runtime_index=""
 
 re_numeric='^[0-9]+$'
 original_cmd="$0 $(printf "%q " "$@")"
@@ -84,6 +85,8 @@ optional arguments:
  --multi                               multi-argument jobs
  --tool-dir DIR                        alpha-beta-CROWN repo dir (enables AB mode)
  --python-bin BIN                      python executable (default: python3)
+ --runtime-index FILE                  set per-instance time limits from predicted
+                                       runtimes in FILE (see build_feature_index.py)
  --notify <email>                      send email when job is done
 "
 }
@@ -180,6 +183,10 @@ do
       shift
       python_bin="$1"
       ;;
+    --runtime-index)
+      shift
+      runtime_index="$1"
+      ;;
     --notify)
       shift
       sbatch_options="$sbatch_options --mail-user=$1 --mail-type=END"
@@ -196,8 +203,10 @@ do
 done
 
 use_abcrown="no"
+tool_name="luna"
 if [[ -n "$tool_dir" ]]; then
   use_abcrown="yes"
+  tool_name="abcrown"
 fi
 
 if [[ "$use_abcrown" == "yes" ]]; then
@@ -227,6 +236,13 @@ solver_name=$(basename "$solver")
 info "using solver '$solver'"
 fi
 
+if [[ -n "$runtime_index" ]]; then
+  [[ ! -f "$runtime_index" ]] && \
+    die "runtime index '$runtime_index' does not exist"
+  runtime_index="$(realpath "$runtime_index")"
+  info "using runtime index '$runtime_index'"
+fi
+
 [[ -n "$copy_dir" && ! -e "$copy_dir" ]] && \
   die "copy directory '$copy_dir' does not exist"
 
@@ -396,12 +412,17 @@ fi
 #
 # Configure runlim options
 #
+runlim_time_flag="-t"
+[ -n "$use_wall_time" ] && runlim_time_flag="-r"
+
+# Runtime that per-instance limits apply to (runlim -t is CPU time,
+# runlim -r and timeout on GPU partitions are wall time)
+runtime_metric="cpu_time"
+if [[ -n "$use_wall_time" || $num_gpus -gt 0 ]]; then
+  runtime_metric="wall_time"
+fi
 if [[ $time_limit != 0 ]]; then
-  if [ -z "$use_wall_time" ]; then
-    runlim_options="-t $time_limit"
-  else
-    runlim_options="-r $time_limit"
-  fi
+  runlim_options="$runlim_time_flag $time_limit"
 fi
 runlim_options="$runlim_options -s ${memory_limit}"
 if [[ $num_gpus -gt 0 ]]; then
@@ -442,6 +463,9 @@ working_dir="$(realpath "$working_dir")"
     echo "runlim:         $runlim_options"
   fi
   echo "partition:       $partition"
+  if [[ -n "$runtime_index" ]]; then
+    echo "runtime index:   $runtime_index"
+  fi
 } > "$working_dir/options"
 
 #
@@ -480,6 +504,19 @@ for benchmark_set in $benchmark_sets; do
   # Number of benchmark files = number of jobs in the array job
   ntasks=$(wc -l "$benchmark_set" | cut -d ' ' -f 1)
 
+  # Per-instance time limits from predicted runtimes (one limit per line).
+  # The array job time limit only needs to cover the largest of them.
+  slurm_time_limit=$time_limit
+  if [[ -n "$runtime_index" ]]; then
+    "$python_bin" "$script_dir/build_feature_index.py" --index "$runtime_index" \
+      predict --tool "$tool_name" --metric "$runtime_metric" \
+      --time-limit "$time_limit" "$benchmark_set" \
+      > "$working_dir_set/time_limits" || \
+      die "failed to predict time limits for '$benchmark_set'"
+    slurm_time_limit=$(cut -d ' ' -f 1 "$working_dir_set/time_limits" | sort -n | tail -n 1)
+    info "  $set_name: per-instance time limits up to $slurm_time_limit seconds"
+  fi
+
   # Single-argument script: benchmark set files contain an input file per line
   COMMAND=""
 
@@ -508,7 +545,7 @@ for benchmark_set in $benchmark_sets; do
 #SBATCH -c $num_cpus
 #SBATCH -a 1-$ntasks$ARRAY_THROTTLE
 #SBATCH --partition=$partition
-#SBATCH -t 00:00:$(expr 2 '*' "$time_limit")
+#SBATCH -t 00:00:$(expr 2 '*' "$slurm_time_limit")
 #SBATCH --mem=${memory_limit_slurm}M
 $GPU_DIRECTIVE
 #SBATCH -D $working_dir
@@ -558,6 +595,11 @@ export ARGS
 export OUTPUT
 export LOGDIR
 
+TASK_TIME_LIMIT=$time_limit
+if [ -f "$working_dir_set/time_limits" ]; then
+  read -r TASK_TIME_LIMIT _ <<< "\$(sed \${SLURM_ARRAY_TASK_ID}'q;d' $working_dir_set/time_limits)"
+fi
+
 MODE="$use_abcrown"
 if [[ "\$MODE" == "yes" ]]; then
   export PYTHONPATH="$tool_dir"
@@ -630,26 +672,39 @@ else
   fi
 fi
 
+# Capture the job status without stopping before the result record is
+# written; set -e is re-enabled inside the subshell so a failing tool run
+# still aborts before "c done".
+set +e
 (
+  set -e
   echo "c host:       \$(hostname)"
   echo "c start:      \$(date)"
   echo "c arrayjobid: \${SLURM_ARRAY_JOB_ID}"
   echo "c jobid:      \${SLURM_JOB_ID}"
   echo "c command:    \$COMMAND"
   echo "c args:       \$ARGS"
+  echo "c timelimit:  \$TASK_TIME_LIMIT"
 
   cd "\$LOGDIR"
   if [[ $num_gpus -gt 0 ]]; then
     if [[ $time_limit -gt 0 ]]; then
-      eval "/usr/bin/time -v -o \"\${OUTPUT}\" timeout $time_limit \$COMMAND"
+      eval "/usr/bin/time -v -o \"\${OUTPUT}\" timeout \$TASK_TIME_LIMIT \$COMMAND"
     else
       eval "/usr/bin/time -v -o \"\${OUTPUT}\" \$COMMAND"
     fi
   else
-    eval "$runlim_binary $runlim_options -o \"\${OUTPUT}\" \$COMMAND"
+    eval "$runlim_binary $runlim_time_flag \$TASK_TIME_LIMIT -s ${memory_limit} -o \"\${OUTPUT}\" \$COMMAND"
   fi
   echo "c done"
 ) > "\$out" 2>&1
+JOB_STATUS=\$?
+set -e
+
+# Write machine-readable result record (read by compile_results.py)
+$python_bin "$script_dir/write_result_record.py" --tool "$tool_name" "\$LOGDIR" >> "\$out" 2>&1 || true
+
+exit \$JOB_STATUS
 
 EOF
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Write a machine-readable result record for a single verification job.
+
+Usage:
+    python write_result_record.py --tool {abcrown,luna} <log_dir>
+
+Called by the job wrapper in submit-job.sh once the tool has finished. The
+tool output (run.out) and the runlim / time output (output.log) in <log_dir>
+are parsed once and the result is written to <log_dir>/result.json, which
+compile_results.py reads directly instead of scraping the logs again.
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+from compile_results import (
+    RESULT_RECORD_NAME,
+    RESULT_RECORD_VERSION,
+    parse_abcrown_run_out,
+    parse_luna_run_out,
+    parse_output_log,
+)
+
+
+def encode_bounds(values):
+    """Store non-finite bounds as strings ("inf", "-inf", "nan") to keep strict JSON."""
+    if values is None:
+        return None
+    return [x if math.isfinite(x) else str(x) for x in values]
+
+
+def build_result_record(tool_name, log_dir):
+    """Build the result record for a job from its run.out and output.log."""
+    if tool_name == "abcrown":
+        data = parse_abcrown_run_out(log_dir / "run.out")
+    else:  # luna
+        data = parse_luna_run_out(log_dir / "run.out")
+
+    usage = parse_output_log(log_dir / "output.log", time_output=True)
+
+    return {
+        "version": RESULT_RECORD_VERSION,
+        "tool": tool_name,
+        "onnx_file": data["onnx_file"],
+        "vnnlib_file": data["vnnlib_file"],
+        "onnx_path": data["onnx_path"],
+        "vnnlib_path": data["vnnlib_path"],
+        "result": data["result"],
+        "status": data["status"],
+        "lower_bounds": encode_bounds(data["lower_bounds"]),
+        "upper_bounds": encode_bounds(data["upper_bounds"]),
+        "tool_time": data["time"],
+        "time_limit": data["time_limit"],
+        "wall_time": usage["wall_time"],
+        "cpu_time": usage["cpu_time"],
+        "max_memory_mb": usage["max_memory_mb"],
+        "limit_status": usage["limit_status"],
+        "timed_out": usage["timed_out"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write a machine-readable result record for a verification job."
+    )
+    parser.add_argument(
+        "--tool",
+        choices=["abcrown", "luna"],
+        required=True,
+        help="Tool that produced the logs"
+    )
+    parser.add_argument(
+        "log_dir",
+        type=Path,
+        help="Job log directory (contains run.out and output.log)"
+    )
+    args = parser.parse_args()
+
+    if not (args.log_dir / "run.out").is_file():
+        print(f"Error: no run.out in {args.log_dir}", file=sys.stderr)
+        return 1
+
+    record = build_result_record(args.tool, args.log_dir)
+
+    # Write to a temporary file first so readers never see a partial record
+    record_path = args.log_dir / RESULT_RECORD_NAME
+    tmp_path = record_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(record, f, allow_nan=False)
+        f.write("\n")
+    tmp_path.replace(record_path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())